@@ -1,16 +1,68 @@
 from __future__ import annotations
 
 import bisect
-from collections import UserList, defaultdict
-from typing import Dict, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
 
 from backup_manager.backup_file import BackupAction, BackupFile
 
+_ALL_ACTIONS = frozenset(BackupAction)
+_get_date = attrgetter("date")
+_get_size = attrgetter("size")
 
-class BackupCollection(UserList):
-    """Manages a collection of backups"""
+
+class BackupCollection:
+    """Manages a collection of backups.
+
+    The backups should only be added through the collection methods, which keep the
+    total disk usage up to date.
+    """
 
     data: list[BackupFile]
+    _disk_usage: int
+
+    def __init__(self, data: Optional[Iterable[BackupFile]] = None) -> None:
+        self.data = [] if data is None else list(data)
+        self._disk_usage = sum(map(_get_size, self.data))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[BackupFile]:
+        return iter(self.data)
+
+    def __reversed__(self) -> Iterator[BackupFile]:
+        return reversed(self.data)
+
+    def __contains__(self, backup: BackupFile) -> bool:
+        return backup in self.data
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return BackupCollection(self.data[index])
+        return self.data[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BackupCollection):
+            return self.data == other.data
+        return self.data == other
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+    def append(self, backup: BackupFile) -> None:
+        self.data.append(backup)
+        self._disk_usage += backup.size
+
+    def extend(self, backups: Iterable[BackupFile]) -> None:
+        if isinstance(backups, BackupCollection):
+            backups = backups.data
+        start = len(self.data)
+        self.data.extend(backups)
+        self._disk_usage += sum(map(_get_size, self.data[start:]))
 
     def insort(self, backup: BackupFile) -> None:
         """Inserts a backup into the collection. Utilizes bisect.isort to maintain order
@@ -19,68 +71,140 @@ class BackupCollection(UserList):
             backup (BackupFile): the backup to add to the collection
         """
         bisect.insort(self.data, backup)
+        self._disk_usage += backup.size
 
     def filter(
         self,
-        action_set: Set[BackupAction] = set(BackupAction),
+        action_set: Iterable[BackupAction] = _ALL_ACTIONS,
     ) -> BackupCollection:
         """Returns a new collection of backups that match the specified action list.
 
         Args:
-            action_set (Set[BackupAction], optional): A set of actions to use as filter. Defaults to all available actions.
+            action_set (Iterable[BackupAction], optional): The actions to use as filter. Defaults to all available actions.
 
         Returns:
-            list: A list of backups that match the specified action filter
+            BackupCollection: A collection of backups that match the specified action filter
         """
-        data = [backup_file for backup_file in self if backup_file.action in action_set]
+        # Enum hashing is done in Python, while tuple membership compares by identity
+        actions = tuple(action_set)
+        if not actions:
+            return BackupCollection()
+        if _ALL_ACTIONS.issubset(actions):
+            return BackupCollection(self.data)
+        data = [
+            backup_file for backup_file in self.data if backup_file.action in actions
+        ]
 
         return BackupCollection(data)
 
     def filter_unset(self) -> BackupCollection:
-        return self.filter(set([BackupAction.UNSET]))
+        return self._filter_action(BackupAction.UNSET)
 
     def filter_keep(self) -> BackupCollection:
-        return self.filter(set([BackupAction.KEEP]))
+        return self._filter_action(BackupAction.KEEP)
 
     def filter_delete(self) -> BackupCollection:
-        return self.filter(set([BackupAction.DELETE]))
+        return self._filter_action(BackupAction.DELETE)
 
-    def exclude(self, action_set: Set[BackupAction]) -> BackupCollection:
-        return BackupCollection(
-            [backup for backup in self if backup.action not in action_set]
-        )
+    def exclude(self, action_set: Iterable[BackupAction]) -> BackupCollection:
+        return self.filter(_ALL_ACTIONS.difference(action_set))
 
     def exclude_delete(self) -> BackupCollection:
-        return self.exclude(set([BackupAction.DELETE]))
+        return self._exclude_action(BackupAction.DELETE)
 
     def exclude_unset(self) -> BackupCollection:
-        return self.exclude(set([BackupAction.UNSET]))
+        return self._exclude_action(BackupAction.UNSET)
 
     def exclude_keep(self) -> BackupCollection:
-        return self.exclude(set([BackupAction.KEEP]))
+        return self._exclude_action(BackupAction.KEEP)
+
+    def _filter_action(self, action: BackupAction) -> BackupCollection:
+        return BackupCollection(
+            [backup for backup in self.data if backup.action is action]
+        )
+
+    def _exclude_action(self, action: BackupAction) -> BackupCollection:
+        return BackupCollection(
+            [backup for backup in self.data if backup.action is not action]
+        )
 
     def grouped_by_strftime(self, strfime: str) -> Dict[str, BackupCollection]:
         grouped = defaultdict(BackupCollection)
-        for backup in self.data:
-            grouped[backup.date.strftime(strfime)].append(backup)
+        for date, backup in zip(map(_get_date, self.data), self.data):
+            grouped[date.strftime(strfime)].append(backup)
         return grouped
 
-    def grouped_by_year(self) -> Dict[str, BackupCollection]:
-        return self.grouped_by_strftime("%Y")
+    def _group_key(self, level: str) -> Callable[[datetime], int]:
+        """Returns the function computing the grouping key of a date at a given level.
 
-    def grouped_by_month(self) -> Dict[str, BackupCollection]:
-        return self.grouped_by_strftime("%Y-%m")
+        Keys are built from the integer date components, so they sort the same way as
+        the equivalent strftime keys ("%Y", "%Y-%m" and "%Y-%m-%d") without formatting.
+
+        Args:
+            level (str): one of "year", "month" or "day".
 
-    def grouped_by_day(self) -> Dict[str, BackupCollection]:
-        return self.grouped_by_strftime("%Y-%m-%d")
+        Returns:
+            Callable[[datetime], int]: the key function.
+        """
+        if level == "year":
+            return attrgetter("year")
+        if level == "month":
+            return lambda date: date.year * 100 + date.month
+        if level == "day":
+            return lambda date: date.year * 10000 + date.month * 100 + date.day
+        raise ValueError(f"Unknown grouping level: {level}")
+
+    def grouped_by_level(self, level: str) -> Dict[int, BackupCollection]:
+        key = self._group_key(level)
+        grouped = defaultdict(BackupCollection)
+        for date, backup in zip(map(_get_date, self.data), self.data):
+            grouped[key(date)].append(backup)
+        return grouped
+
+    def grouped_by_year(self) -> Dict[int, BackupCollection]:
+        return self.grouped_by_level("year")
+
+    def grouped_by_month(self) -> Dict[int, BackupCollection]:
+        return self.grouped_by_level("month")
+
+    def grouped_by_day(self) -> Dict[int, BackupCollection]:
+        return self.grouped_by_level("day")
 
     def disk_usage(self) -> int:
-        return sum([backup.size for backup in self])
+        return self._disk_usage
 
     def disk_usage_after_actions(self) -> int:
-        return sum([backup.size for backup in self.exclude_delete()])
+        return sum(
+            backup.size
+            for backup in self.data
+            if backup.action is not BackupAction.DELETE
+        )
 
-    def apply_actions(self):
-        for backup in self:
-            backup.apply_action()
-        self = self.filter_keep()
+    def apply_actions(self, max_workers: int = 16):
+        """Applies the action of every backup in the collection.
+
+        Deletions are spread over a thread pool so the unlink calls overlap. The deleted
+        backups are then removed from the collection. If any deletion fails, the others
+        still run, the failed backups stay in the collection and the first error is
+        raised once the collection is updated.
+
+        Args:
+            max_workers (int, optional): maximum number of threads used. Defaults to 16.
+        """
+        to_delete = [
+            backup for backup in self.data if backup.action is BackupAction.DELETE
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(backup.apply_action) for backup in to_delete]
+        deleted = set()
+        error = None
+        for backup, future in zip(to_delete, futures):
+            exception = future.exception()
+            if exception is None:
+                deleted.add(id(backup))
+                self._disk_usage -= backup.size
+            elif error is None:
+                error = exception
+        self.data[:] = [backup for backup in self.data if id(backup) not in deleted]
+        if error is not None:
+            raise error
@@ -1,10 +1,38 @@
 from __future__ import annotations
 
 import enum
+import os
 import re
-from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
+
+_COLLECTION_RE = re.compile(r"(.*)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}\.tar\Z")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp(date: datetime) -> float:
+    """Returns the POSIX timestamp of a date, even one the platform can't convert.
+
+    datetime.timestamp() goes through the C library for naive dates and rejects years
+    outside its range. Those dates are converted as if they were UTC instead, which can
+    be off by the local UTC offset.
+
+    Naive local dates don't map monotonically to timestamps either: a time inside a DST
+    gap converts to a later timestamp than a real time shortly after it. BackupFile
+    therefore compares backups built from dates on their dates, not on this value.
+
+    Args:
+        date (datetime): the date to convert.
+
+    Returns:
+        float: the timestamp of the date.
+    """
+    try:
+        return date.timestamp()
+    except (OverflowError, OSError, ValueError):
+        epoch = _EPOCH if date.tzinfo is None else _EPOCH.replace(tzinfo=timezone.utc)
+        return (date - epoch).total_seconds()
 
 
 class BackupAction(enum.Enum):
@@ -19,27 +47,87 @@ class BackupAction(enum.Enum):
     DELETE = 2
 
 
-@dataclass
 class BackupFile:
+    """A backup file on disk.
+
+    Backups are ordered and compared by mtime, unless both were built from a date, in
+    which case their dates are used. Collections sorted on mtime, like the ones built by
+    main, only hold backups created with from_path.
+    """
+
+    __slots__ = ("path", "size", "_date", "_date_given", "mtime", "action")
+
     path: Path
     size: int
-    date: datetime
-    action: BackupAction = field(default=BackupAction.UNSET)
+    mtime: float
+    action: BackupAction
+
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        date: Optional[datetime] = None,
+        action: BackupAction = BackupAction.UNSET,
+        mtime: Optional[float] = None,
+    ) -> None:
+        if date is None and mtime is None:
+            raise ValueError("Either date or mtime must be given")
+        self.path = path
+        self.size = size
+        self._date = date
+        self._date_given = date is not None
+        self.mtime = _timestamp(date) if mtime is None else mtime
+        self.action = action
+
+    @property
+    def date(self) -> datetime:
+        """The modification date of the backup, built from mtime on first access."""
+        if self._date is None:
+            self._date = datetime.fromtimestamp(self.mtime)
+        return self._date
+
+    @date.setter
+    def date(self, date: datetime) -> None:
+        self._date = date
+        self._date_given = True
+        self.mtime = _timestamp(date)
+
+    def __repr__(self) -> str:
+        return (
+            f"BackupFile(path={self.path!r}, size={self.size!r}, "
+            f"date={self.date!r}, action={self.action!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self._date_given and other._date_given:
+            same_time = self._date == other._date
+        else:
+            same_time = self.mtime == other.mtime
+        return same_time and (self.path, self.size, self.action) == (
+            other.path,
+            other.size,
+            other.action,
+        )
 
     @staticmethod
-    def from_path(path: Path) -> BackupAction:
+    def from_path(path: Path, stat: Optional[os.stat_result] = None) -> BackupFile:
         """Create a BackupFile from a given path.
 
         Args:
             path (Path): The file Path
+            stat (os.stat_result, optional): The file stat, if known. Defaults to None.
 
         Returns:
-            [type]: The created BackupFile.
+            BackupFile: The created BackupFile.
         """
+        if stat is None:
+            stat = path.stat()
         return BackupFile(
             path=path,
-            size=path.stat().st_size,
-            date=datetime.fromtimestamp(path.stat().st_mtime),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
         )
 
     def guess_collection_from_filename(self) -> str:
@@ -49,10 +137,8 @@ class BackupFile:
         Returns:
             str: the guessed collection name.
         """
-        if match := re.match(
-            r"^(?P<collection>.*)_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}\.tar$", self.path.name
-        ):
-            return match.group("collection")
+        if match := _COLLECTION_RE.match(self.path.name):
+            return match.group(1)
         return self.path.parent.name
 
     def set_action(self, action: BackupAction, force: bool = False) -> bool:
@@ -65,14 +151,9 @@ class BackupFile:
         Returns:
             bool: True if the action was set, False otherwise. Always true if force is True.
         """
-        if force:
-            self.action = action
-            return True
-
-        if self.action != BackupAction.UNSET:
-            return False
-
-        if action == self.action:
+        if not force and (
+            self.action is not BackupAction.UNSET or action is BackupAction.UNSET
+        ):
             return False
 
         self.action = action
@@ -83,4 +164,6 @@ class BackupFile:
             self.path.unlink()
 
     def __lt__(self, other):
-        return self.date < other.date
+        if self._date_given and other._date_given:
+            return self._date < other._date
+        return self.mtime < other.mtime
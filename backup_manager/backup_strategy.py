@@ -1,4 +1,5 @@
 from abc import ABC, abstractclassmethod
+from typing import Dict, Optional
 
 from backup_manager.backup_collection import BackupCollection
 from backup_manager.backup_file import BackupAction
@@ -8,23 +9,48 @@ class BackupStrategy(ABC):
     action: BackupAction = BackupAction.UNSET
 
     @abstractclassmethod
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
 
         """Apply the strategy on the given collection.
 
         Args:
             collection (BackupCollection): the collection to apply the strategy on.
+            cache (Dict, optional): data derived from the collection and shared between
+                strategies applied on it. Only holds data unaffected by backup actions.
 
         Returns:
             BackupCollection: a new collection containing only the backups that got the strategy applied.
         """
         pass
 
+    @staticmethod
+    def grouped_by_month(
+        collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> Dict[int, BackupCollection]:
+        """Returns the collection grouped by month, reusing the cached grouping if any.
+
+        Args:
+            collection (BackupCollection): the collection to group.
+            cache (Dict, optional): cache shared between strategies. Defaults to None.
+
+        Returns:
+            Dict[int, BackupCollection]: the backups grouped by month.
+        """
+        if cache is None:
+            return collection.grouped_by_month()
+        if "by_month" not in cache:
+            cache["by_month"] = collection.grouped_by_month()
+        return cache["by_month"]
+
 
 class BasicStrategy(BackupStrategy):
     """Basic implementation of a strategy. Applies the same action to all backups"""
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         applied_backups = []
         for backup in collection.data:
             if backup.set_action(self.action):
@@ -51,18 +77,29 @@ class LastN(BackupStrategy):
     def __init__(self, n: int = 7) -> None:
         self.n = n
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         applied_backups = []
-        for backup in collection.filter_unset()[-self.n :]:
+        unset_found = 0
+        for backup in reversed(collection.data):
+            if unset_found >= self.n:
+                break
+            if backup.action is not BackupAction.UNSET:
+                continue
+            unset_found += 1
             if backup.set_action(self.action):
                 applied_backups.append(backup)
+        applied_backups.reverse()
         return BackupCollection(applied_backups)
 
 
 class DeleteUnset(BackupStrategy):
     action = BackupAction.DELETE
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         applied_backups = []
         for backup in collection.filter_unset():
             if backup.set_action(self.action):
@@ -77,7 +114,9 @@ class DayOfMonth(BackupStrategy):
     def __init__(self, day: int = 1) -> None:
         self.day = day
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         """Applies action to backups that match being on the given day of the month.
 
         If the given day is outside of range (day 31 on a month with 30 days), the action is not applied.
@@ -89,7 +128,8 @@ class DayOfMonth(BackupStrategy):
             BackupCollection: a new collection containing only the backups that got the strategy applied.
         """
         applied_backups = []
-        for _month, month_collection in collection.grouped_by_month().items():
+        grouped_by_month = self.grouped_by_month(collection, cache)
+        for _month, month_collection in grouped_by_month.items():
             for backup in month_collection:
                 if backup.date.day == self.day:
                     if backup.set_action(self.action):
@@ -104,9 +144,11 @@ class LastOfNMonths(BackupStrategy):
     def __init__(self, n: int = 12) -> None:
         self.n = n
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         applied_backups = []
-        grouped_by_month = collection.grouped_by_month()
+        grouped_by_month = self.grouped_by_month(collection, cache)
         months = sorted(grouped_by_month.keys())[-self.n :]
         for month in months:
             last_of_month = grouped_by_month[month][-1]
@@ -118,7 +160,9 @@ class LastOfNMonths(BackupStrategy):
 class DeleteUnset(BackupStrategy):
     action = BackupAction.DELETE
 
-    def apply_on(self, collection: BackupCollection) -> BackupCollection:
+    def apply_on(
+        self, collection: BackupCollection, cache: Optional[Dict] = None
+    ) -> BackupCollection:
         applied_backups = []
         for backup in collection.filter_unset():
             if backup.set_action(self.action):
@@ -1,9 +1,12 @@
 import argparse
+import os
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from backup_manager.backup_collection import BackupCollection
-from backup_manager.backup_file import BackupFile
+from backup_manager.backup_file import BackupAction, BackupFile
 from backup_manager.backup_strategy import (
     BackupStrategy,
     DeleteUnset,
@@ -13,58 +16,100 @@ from backup_manager.backup_strategy import (
 
 
 def apply_strategies(collection: BackupCollection, strategies: List[BackupStrategy]):
+    cache = {}
     for strategy in strategies:
-        strategy.apply_on(collection)
+        strategy.apply_on(collection, cache)
 
 
 def fancy_print(collection_name: str, collection: BackupCollection):
-    modified = collection.exclude_unset()
-    untouched = collection.filter_unset()
-    to_keep = collection.filter_keep()
-    to_delete = collection.filter_delete()
-    disk_usage = collection.disk_usage()
-    disk_usage_after_actions = collection.disk_usage_after_actions()
+    untouched = to_keep = to_delete = 0
+    disk_usage = disk_usage_after_actions = 0
+    for backup in collection:
+        size = backup.size
+        disk_usage += size
+        action = backup.action
+        if action is BackupAction.KEEP:
+            to_keep += 1
+            disk_usage_after_actions += size
+        elif action is BackupAction.DELETE:
+            to_delete += 1
+        else:
+            untouched += 1
+            disk_usage_after_actions += size
+    modified = to_keep + to_delete
     disk_usage_reduction = disk_usage / disk_usage_after_actions
     print(f"Collection: {collection_name}")
     print(f"Total backups: {len(collection)}")
-    print(f"Modified backups: {len(modified)}")
-    print(f"Untouched backups: {len(untouched)}")
-    print(f"To keep: {len(to_keep)}")
-    print(f"To delete: {len(to_delete)}")
+    print(f"Modified backups: {modified}")
+    print(f"Untouched backups: {untouched}")
+    print(f"To keep: {to_keep}")
+    print(f"To delete: {to_delete}")
     print(f"Disk usage: {disk_usage} bytes")
     print(f"Disk usage after actions: {disk_usage_after_actions} bytes")
     print(f"Disk usage reduction: {disk_usage_reduction:.2f}x")
 
 
-def find_backup_files(path, glob_filter="**/*.tar"):
-    backups = []
-    for file_path in path.glob(glob_filter):
-        if not file_path.is_file():
-            continue
-        backups.append(BackupFile.from_path(file_path))
-    return backups
+def find_backup_entries(
+    path: Path, suffixes: Tuple[str, ...], recursive: bool = False
+) -> Iterator[os.DirEntry]:
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if recursive and entry.is_dir(follow_symlinks=False):
+                yield from find_backup_entries(Path(entry.path), suffixes, recursive)
+            elif entry.name.endswith(suffixes) and entry.is_file():
+                yield entry
+
+
+def backup_file_from_entry(entry: os.DirEntry) -> Optional[BackupFile]:
+    try:
+        entry_stat = entry.stat()
+    except OSError:
+        return None
+    return BackupFile.from_path(Path(entry.path), entry_stat)
+
+
+def find_backup_files(
+    path: Path, extensions: List[str], recursive: bool = False
+) -> Iterator[BackupFile]:
+    """Walks the given path and yields the backup files matching any of the extensions.
+
+    Each file is stat'ed through the DirEntry found by the walk. Folders that can't be
+    read and files that can't be stat'ed are skipped.
+
+    Args:
+        path (Path): the folder to search.
+        extensions (List[str]): the file extensions to match, without the leading dot.
+        recursive (bool, optional): walk subfolders too. Defaults to False.
+
+    Yields:
+        BackupFile: the backup files found.
+    """
+    suffixes = tuple(f".{extension}" for extension in extensions)
+    backup_entries = find_backup_entries(path, suffixes, recursive)
+    for backup_file in map(backup_file_from_entry, backup_entries):
+        if backup_file is not None:
+            yield backup_file
 
 
 def build_collections_from_backup_file_list(
-    backup_file_list: List[BackupFile],
+    backup_file_list: Iterable[BackupFile],
 ) -> Dict[str, BackupCollection]:
-    collections: Dict[str, BackupCollection] = {}
+    backups_by_collection: Dict[str, List[BackupFile]] = defaultdict(list)
     for backup_file in backup_file_list:
         collection_name = backup_file.guess_collection_from_filename()
-        if collection_name not in collections:
-            collections[collection_name] = BackupCollection()
-        collections[collection_name].insort(backup_file)
-    return dict(collections)
+        backups_by_collection[collection_name].append(backup_file)
+    return {
+        collection_name: BackupCollection(sorted(backups, key=attrgetter("mtime")))
+        for collection_name, backups in backups_by_collection.items()
+    }
 
 
 def main(path: Path, extensions: List[str], recursive: bool, dry_run: bool):
-    backups = []
-    for extension in extensions:
-        glob = f"*.{extension}"
-        if recursive:
-            glob = "**/" + glob
-        backups.extend(find_backup_files(path, glob))
-
+    backups = find_backup_files(path, extensions, recursive)
     collections = build_collections_from_backup_file_list(backups)
     strategies = [LastN(n=7), LastOfNMonths(n=12), DeleteUnset()]
     for collection_name, collection in collections.items():